@@ -17,13 +17,18 @@ class EscapeRoomContext:
     relay_hardware_devices: Dict[str, OutputDevice] = field(default_factory=dict)
     relay_devices: Dict[str, OutputDevice] = field(default_factory=dict)
     current_relays: Dict[str, bool] = field(default_factory=dict)
+    # lock guards game state, timer and language; inputs and relays have their own locks.
     lock: threading.Lock = field(default_factory=threading.Lock)
+    inputs_lock: threading.Lock = field(default_factory=threading.Lock)
+    relays_lock: threading.Lock = field(default_factory=threading.Lock)
+    # current_inputs and current_relays are copy-on-write: writers swap in a new dict
+    # under their lock, so readers can share the current dict without copying it.
     current_inputs: Dict[str, str] = field(default_factory=dict)
     previous_inputs: Dict[str, str] = field(default_factory=dict)
     game_state: str = "idle"
     timer_running: bool = False
-    timer_started_at: Optional[float] = None
-    timer_elapsed_base: float = 0.0
+    timer_started_at_ns: Optional[int] = None
+    timer_elapsed_base_ns: int = 0
     hints_by_lang: dict = field(default_factory=dict)
     hint_index_by_lang: dict = field(default_factory=dict)
     current_language: str = "nl"
@@ -37,11 +42,15 @@ class EscapeRoomContext:
             current_language=load_language(),
         )
 
+    def get_timer_elapsed_ns_locked(self) -> int:
+        """Return timer elapsed nanoseconds. Caller must hold self.lock."""
+        if not self.timer_running or self.timer_started_at_ns is None:
+            return self.timer_elapsed_base_ns
+        return self.timer_elapsed_base_ns + (time.monotonic_ns() - self.timer_started_at_ns)
+
     def get_timer_elapsed_locked(self) -> float:
         """Return timer elapsed seconds. Caller must hold self.lock."""
-        if not self.timer_running or self.timer_started_at is None:
-            return float(self.timer_elapsed_base)
-        return float(self.timer_elapsed_base + (time.monotonic() - self.timer_started_at))
+        return self.get_timer_elapsed_ns_locked() / 1e9
 
     def snapshot_timer_locked(self) -> dict:
         """Return timer payload. Caller must hold self.lock."""
@@ -58,20 +67,20 @@ class EscapeRoomContext:
         with self.lock:
             if not self.timer_running:
                 return None
-            self.timer_elapsed_base = self.get_timer_elapsed_locked()
+            self.timer_elapsed_base_ns = self.get_timer_elapsed_ns_locked()
             self.timer_running = False
-            self.timer_started_at = None
+            self.timer_started_at_ns = None
             return self.snapshot_timer_locked()
 
     def toggle_timer(self):
         with self.lock:
             if self.timer_running:
-                self.timer_elapsed_base = self.get_timer_elapsed_locked()
+                self.timer_elapsed_base_ns = self.get_timer_elapsed_ns_locked()
                 self.timer_running = False
-                self.timer_started_at = None
+                self.timer_started_at_ns = None
                 action = "paused"
             else:
-                self.timer_started_at = time.monotonic()
+                self.timer_started_at_ns = time.monotonic_ns()
                 self.timer_running = True
                 action = "resumed"
             return action, self.snapshot_timer_locked()
@@ -98,15 +107,19 @@ class EscapeRoomContext:
 
         with self.lock:
             state_name = self.game_state
-            return {
-                "game_state": state_name,
-                "language": self.current_language,
-                "inputs": dict(self.current_inputs),
-                "relays": dict(self.current_relays),
-                "hints": self.get_hints_payload_for_state_locked(state_name),
-                "timer": self.snapshot_timer_locked(),
-                "sound": get_sound_status(),
-            }
+            language = self.current_language
+            hints = self.get_hints_payload_for_state_locked(state_name)
+            timer = self.snapshot_timer_locked()
+
+        return {
+            "game_state": state_name,
+            "language": language,
+            "inputs": self.snapshot_inputs(),
+            "relays": self.snapshot_relays(),
+            "hints": hints,
+            "timer": timer,
+            "sound": get_sound_status(),
+        }
 
     def snapshot_index(self) -> dict:
         with self.lock:
@@ -116,92 +129,100 @@ class EscapeRoomContext:
             }
 
     def snapshot_inputs(self) -> dict:
-        with self.lock:
-            return dict(self.current_inputs)
+        """Return the shared, read-only inputs dict."""
+        return self.current_inputs
 
     def snapshot_relays(self) -> dict:
-        with self.lock:
-            return dict(self.current_relays)
+        """Return the shared, read-only relays dict."""
+        return self.current_relays
 
-    def snapshot_rule_inputs(self) -> dict:
+    def snapshot_rule_inputs(self, labels, skip_states=()) -> Optional[dict]:
+        """Return rule inputs for the given labels, or None when game_state is in skip_states."""
         with self.lock:
+            game_state = self.game_state
+        if game_state in skip_states:
+            return None
+
+        with self.inputs_lock:
             return {
-                "game_state": self.game_state,
-                "inputs": dict(self.current_inputs),
-                "previous_inputs": dict(self.previous_inputs),
+                "game_state": game_state,
+                "inputs": {label: self.current_inputs.get(label) for label in labels},
+                "previous_inputs": {label: self.previous_inputs.get(label) for label in labels},
             }
 
     def set_input_state(self, label: str, state: str) -> None:
-        with self.lock:
+        with self.inputs_lock:
             prev = self.current_inputs.get(label)
             self.previous_inputs[label] = prev if prev is not None else state
-            self.current_inputs[label] = state
+            self.current_inputs = {**self.current_inputs, label: state}
 
     def register_input_device(self, label: str, device: object) -> None:
-        with self.lock:
+        with self.inputs_lock:
             self.devices[label] = device
 
-    def get_input_button(self, label: str):
-        with self.lock:
-            return self.devices[label].button
-
     def register_relay_device(self, name: str, device: OutputDevice, active: bool = True) -> None:
-        with self.lock:
+        with self.relays_lock:
             self.relay_hardware_devices[name] = device
             if active:
                 self.relay_devices[name] = device
-                self.current_relays[name] = False
+                self.current_relays = {**self.current_relays, name: False}
 
     def get_relay_devices(self) -> dict:
-        with self.lock:
+        with self.relays_lock:
             return dict(self.relay_devices)
 
     def get_relay_hardware_devices(self) -> dict:
-        with self.lock:
+        with self.relays_lock:
             return dict(self.relay_hardware_devices)
 
     def has_relay_device(self, name: str) -> bool:
-        with self.lock:
+        with self.relays_lock:
             return name in self.relay_devices
 
     def decide_relay_toggle(self, name: str):
-        with self.lock:
+        with self.relays_lock:
             dev = self.relay_devices[name]
             new = not bool(self.current_relays.get(name, False))
-            self.current_relays[name] = new
+            self.current_relays = {**self.current_relays, name: new}
             return dev, new
 
     def apply_relay_pattern_decision(self, pattern: dict):
         actions = []
-        with self.lock:
+        with self.relays_lock:
+            relays = dict(self.current_relays)
             for relay_name, on in pattern.items():
                 dev = self.relay_devices.get(relay_name)
-                if not dev:
+                if not dev or relays.get(relay_name) == bool(on):
                     continue
-                self.current_relays[relay_name] = bool(on)
+                relays[relay_name] = bool(on)
                 actions.append((dev, bool(on)))
+            self.current_relays = relays
         return actions
 
     def is_idle(self) -> bool:
         with self.lock:
             return self.game_state == "idle"
 
-    def prepare_state_entry(self, new_state: str, entry_actions) -> None:
+    def prepare_state_entry(self, new_state: str, entry_actions, force: bool = False) -> bool:
+        """Enter new_state; return False without changes if already there and not forced."""
         with self.lock:
+            if new_state == self.game_state and not force:
+                return False
             self.game_state = new_state
             for action in entry_actions:
                 if action == "reset_timer":
                     self.timer_running = False
-                    self.timer_started_at = None
-                    self.timer_elapsed_base = 0.0
+                    self.timer_started_at_ns = None
+                    self.timer_elapsed_base_ns = 0
                 elif action == "start_timer_if_fresh":
                     if (
                         (not self.timer_running)
-                        and (self.timer_started_at is None)
-                        and (self.timer_elapsed_base == 0.0)
+                        and (self.timer_started_at_ns is None)
+                        and (self.timer_elapsed_base_ns == 0)
                     ):
-                        self.timer_started_at = time.monotonic()
+                        self.timer_started_at_ns = time.monotonic_ns()
                         self.timer_running = True
+            return True
 
     def set_language(self, language: str) -> dict:
         with self.lock:
@@ -0,0 +1,43 @@
+import logging
+import queue
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+AUDIO_QUEUE_SIZE = 64
+
+_audio_q: "queue.Queue[tuple]" = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
+_lock = threading.Lock()
+_worker_started = False
+
+
+def _audio_worker() -> None:
+    while True:
+        fn, args = _audio_q.get()
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("%s failed", fn.__name__)
+
+
+def start_audio_worker() -> None:
+    global _worker_started
+
+    with _lock:
+        if _worker_started:
+            return
+        _worker_started = True
+
+    threading.Thread(target=_audio_worker, name="audio-worker", daemon=True).start()
+
+
+def submit_audio(fn: Callable, *args) -> bool:
+    """Queue an MQTT audio call so state transitions never wait on the broker."""
+    start_audio_worker()
+    try:
+        _audio_q.put_nowait((fn, args))
+    except queue.Full:
+        logger.warning("queue full, dropped %s%r", fn.__name__, args)
+        return False
+    return True
@@ -1,29 +1,42 @@
 import queue
 import threading
-from typing import List
+from typing import Optional, Tuple
+
+import orjson
+
+# Per-client backlog; the event rate is low, so a stalled client only needs recent events.
+CLIENT_QUEUE_SIZE = 32
 
 
 class Broadcaster:
     def __init__(self) -> None:
+        # Writers rebuild the tuple under the lock; publish() reads it without locking.
         self._lock = threading.Lock()
-        self._clients: List["queue.Queue[dict]"] = []
+        self._clients: Tuple["queue.Queue[bytes]", ...] = ()
 
-    def register(self) -> "queue.Queue[dict]":
-        q: "queue.Queue[dict]" = queue.Queue(maxsize=200)
+    def register(self, limit: Optional[int] = None) -> Optional["queue.Queue[bytes]"]:
+        """Add a subscriber queue, or return None if limit subscribers are already registered."""
+        q: "queue.Queue[bytes]" = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
         with self._lock:
-            self._clients.append(q)
+            if limit is not None and len(self._clients) >= limit:
+                return None
+            self._clients = self._clients + (q,)
         return q
 
-    def unregister(self, q: "queue.Queue[dict]") -> None:
+    def unregister(self, q: "queue.Queue[bytes]") -> None:
         with self._lock:
-            if q in self._clients:
-                self._clients.remove(q)
+            self._clients = tuple(c for c in self._clients if c is not q)
 
     def publish(self, event: dict) -> None:
-        with self._lock:
-            clients = list(self._clients)
-        for q in clients:
+        # Encode the SSE frame once; every subscriber gets the same bytes.
+        frame = b"data: " + orjson.dumps(event) + b"\n\n"
+        for q in self._clients:
             try:
-                q.put_nowait(event)
+                q.put_nowait(frame)
             except queue.Full:
-                pass
+                # Drop the oldest frame so the newest state always gets through.
+                try:
+                    q.get_nowait()
+                    q.put_nowait(frame)
+                except (queue.Empty, queue.Full):
+                    pass
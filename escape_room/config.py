@@ -3,6 +3,13 @@ from pathlib import Path
 HOST = "0.0.0.0"
 PORT = 8000
 
+# Each open /events stream holds one waitress worker thread for its lifetime, so
+# the pool is sized for the dashboard cap plus threads kept free for the API.
+MAX_SSE_CLIENTS = 32
+API_THREADS = 8
+SERVER_THREADS = MAX_SSE_CLIENTS + API_THREADS
+SSE_KEEPALIVE_SECONDS = 15
+
 INPUTS = {
     "Boek 1": {"pin": 17, "bounce_time": 0.05, "role": "rs1"},
     "Boek 2": {"pin": 27, "bounce_time": 0.05, "role": "rs2"},
@@ -35,6 +42,9 @@ RELAY_PATTERNS = {
 
 ACTIVE_WHEN_OPEN = True
 
+# Inputs are polled at this interval; a level must hold for the input's bounce_time to count.
+INPUT_POLL_INTERVAL = 0.02
+
 VALID_GAME_STATES = ("idle", "scene_1", "scene_2", "end_game")
 
 STATE_UI = {
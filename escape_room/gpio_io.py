@@ -1,11 +1,19 @@
+import logging
+import threading
 import time
 from dataclasses import dataclass
+from typing import List
 
 from gpiozero import Button
 
-from .config import ACTIVE_WHEN_OPEN, INPUTS
+from .config import ACTIVE_WHEN_OPEN, INPUT_POLL_INTERVAL, INPUTS
 from .state_machine import StateMachine
 
+logger = logging.getLogger(__name__)
+
+_INVERT = bool(ACTIVE_WHEN_OPEN)
+_STATE_STR = ("INACTIVE", "ACTIVE")
+
 
 @dataclass
 class InputDevice:
@@ -17,12 +25,11 @@ class InputDevice:
 
 
 def logical_active_from_button(btn: Button) -> bool:
-    pressed = bool(btn.is_pressed)
-    return (not pressed) if ACTIVE_WHEN_OPEN else pressed
+    return btn.is_pressed ^ _INVERT
 
 
 def set_input_state(ctx, label: str, is_active: bool) -> None:
-    state = "ACTIVE" if is_active else "INACTIVE"
+    state = _STATE_STR[is_active]
     ctx.set_input_state(label, state)
 
     ctx.broadcaster.publish({
@@ -37,28 +44,65 @@ def evaluate_rules_on_change(ctx, changed_label: str) -> None:
     StateMachine(ctx).handle_input_change(changed_label)
 
 
+def poll_inputs(ctx, devices: List[InputDevice]) -> None:
+    """Commit an input change only once its level has held for the input's bounce_time."""
+    inputs = ctx.snapshot_inputs()
+    committed = {dev.label: inputs.get(dev.label) == "ACTIVE" for dev in devices}
+    last_seen = dict(committed)
+    stable_since = {dev.label: time.monotonic() for dev in devices}
+
+    # Bind everything the loop touches to locals; this runs every INPUT_POLL_INTERVAL.
+    polled = tuple((dev.label, dev.button, dev.bounce_time) for dev in devices)
+    logical_active = logical_active_from_button
+    sleep = time.sleep
+    monotonic = time.monotonic
+    interval = INPUT_POLL_INTERVAL
+
+    while True:
+        sleep(interval)
+        now = monotonic()
+
+        for label, btn, bounce_time in polled:
+            # One failed read or commit must not stop polling for every input.
+            try:
+                active = logical_active(btn)
+
+                if active != last_seen[label]:
+                    last_seen[label] = active
+                    stable_since[label] = now
+                    continue
+
+                if active == committed[label] or now - stable_since[label] < bounce_time:
+                    continue
+
+                committed[label] = active
+                set_input_state(ctx, label, active)
+                evaluate_rules_on_change(ctx, label)
+            except Exception:
+                logger.exception("input polling failed for %s", label)
+
+
 def init_gpio(ctx) -> None:
+    devices = []
+
     for label, cfg in INPUTS.items():
         pin = int(cfg["pin"])
         bounce_time = float(cfg.get("bounce_time", 0.05))
         role = str(cfg.get("role", ""))
 
-        btn = Button(pin, pull_up=True, active_state=None, bounce_time=bounce_time)
+        # Debouncing happens in poll_inputs, so gpiozero edge detection is not needed.
+        btn = Button(pin, pull_up=True, active_state=None)
 
-        ctx.register_input_device(label, InputDevice(
+        dev = InputDevice(
             label=label,
             pin=pin,
             bounce_time=bounce_time,
             role=role,
             button=btn,
-        ))
+        )
+        ctx.register_input_device(label, dev)
+        devices.append(dev)
 
         set_input_state(ctx, label, logical_active_from_button(btn))
 
-        def on_change(lab=label):
-            btn = ctx.get_input_button(lab)
-            set_input_state(ctx, lab, logical_active_from_button(btn))
-            evaluate_rules_on_change(ctx, lab)
-
-        btn.when_pressed = on_change
-        btn.when_released = on_change
+    threading.Thread(target=poll_inputs, args=(ctx, devices), name="gpio-poll", daemon=True).start()
@@ -24,7 +24,8 @@ def relays_off(ctx, reason: str) -> None:
     })
 
 
-def apply_relay_pattern(ctx, state_name: str, reason: str) -> None:
+def apply_relay_pattern(ctx, state_name: str) -> None:
+    """Drive relays to the state's pattern; the caller's full_state publish reports them."""
     pattern = RELAY_PATTERNS.get(state_name)
     if not pattern:
         return
@@ -36,14 +37,6 @@ def apply_relay_pattern(ctx, state_name: str, reason: str) -> None:
         else:
             dev.off()
 
-    ctx.broadcaster.publish({
-        "type": "relays",
-        "state": state_name,
-        "pattern": pattern,
-        "reason": reason,
-        "ts": time.time(),
-    })
-
 
 def toggle_relay(ctx, name: str):
     dev, new = ctx.decide_relay_toggle(name)
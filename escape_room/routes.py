@@ -1,21 +1,33 @@
-import json
+import queue
 import re
 import subprocess
 import time
 
+import orjson
 from flask import Response, abort, jsonify, render_template, request
 
-from mqtt_sound import bg_start, bg_stop, bg_switch, hint_play, panic, set_language as mqtt_set_language
+from mqtt_sound import bg_start, bg_stop, bg_switch, hint_play, panic
 
-from .config import BACKGROUND_AUDIO_EXTENSIONS, SUPPORTED_LANGUAGES, VALID_GAME_STATES
+from .audio_worker import submit_audio
+from .config import (
+    BACKGROUND_AUDIO_EXTENSIONS,
+    MAX_SSE_CLIENTS,
+    SSE_KEEPALIVE_SECONDS,
+    SUPPORTED_LANGUAGES,
+    VALID_GAME_STATES,
+)
 from .hints import find_hint_by_id
 from .relays import toggle_relay
+from .sound_sync import sync_language
 from .state import save_language, set_game_state
 from .timer import toggle_timer
 from .ui_config import get_ui_config
 
 
 _BG_FILE_RE = re.compile(r"^state\d+\.mp3$", re.IGNORECASE)
+_HELLO = b"event: hello\ndata: {}\n\n"
+_KEEPALIVE = b":\n\n"
+_SORTED_LANGUAGES = sorted(SUPPORTED_LANGUAGES)
 
 
 def _validate_bg_file(filename: str) -> str:
@@ -26,6 +38,17 @@ def _validate_bg_file(filename: str) -> str:
     return filename
 
 
+def _spawn_detached(cmd) -> None:
+    subprocess.Popen(
+        cmd,
+        start_new_session=True,
+        close_fds=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        # stderr stays inherited so sudo failures reach the service journal.
+    )
+
+
 def register_routes(app, ctx) -> None:
     @app.route("/")
     def index():
@@ -37,7 +60,7 @@ def register_routes(app, ctx) -> None:
             inputs=ui_config["inputs"],
             game_state=snapshot["game_state"],
             language=snapshot["language"],
-            supported_languages=sorted(SUPPORTED_LANGUAGES),
+            supported_languages=_SORTED_LANGUAGES,
             ui_config=ui_config,
         )
 
@@ -50,7 +73,7 @@ def register_routes(app, ctx) -> None:
         snapshot = ctx.snapshot_state()
         ui_config = get_ui_config()
 
-        return jsonify({
+        return Response(orjson.dumps({
             "game_state": snapshot["game_state"],
             "language": snapshot["language"],
             "inputs": snapshot["inputs"],
@@ -64,7 +87,7 @@ def register_routes(app, ctx) -> None:
             "cameras": ui_config["cameras"],
             "languages": ui_config["languages"],
             "text": ui_config["text"],
-        })
+        }), mimetype="application/json")
 
     @app.route("/api/language", methods=["POST"])
     def api_language():
@@ -77,7 +100,7 @@ def register_routes(app, ctx) -> None:
         lang = save_language(new_lang)
         snapshot = ctx.set_language(lang)
 
-        mqtt_set_language(snapshot["language"])
+        sync_language(ctx)
 
         ctx.broadcaster.publish({
             "type": "language",
@@ -132,7 +155,7 @@ def register_routes(app, ctx) -> None:
         })
 
         try:
-            subprocess.Popen(["sudo", "/usr/sbin/poweroff"])
+            _spawn_detached(["sudo", "-n", "/usr/sbin/poweroff"])
         except Exception as e:
             return jsonify({"ok": False, "error": str(e)}), 500
 
@@ -151,7 +174,7 @@ def register_routes(app, ctx) -> None:
         })
 
         try:
-            subprocess.Popen(["sudo", "/usr/sbin/reboot"])
+            _spawn_detached(["sudo", "-n", "/usr/sbin/reboot"])
         except Exception as e:
             return jsonify({"ok": False, "error": str(e)}), 500
 
@@ -159,20 +182,27 @@ def register_routes(app, ctx) -> None:
 
     @app.route("/events")
     def events():
-        q = ctx.broadcaster.register()
+        q = ctx.broadcaster.register(limit=MAX_SSE_CLIENTS)
+        if q is None:
+            # Refuse extra streams so API requests always have a free worker thread.
+            # EventSource ignores Retry-After; app.js reopens closed streams after 30 s.
+            return jsonify({"ok": False, "error": "too_many_clients"}), 503, {"Retry-After": "30"}
 
         def gen():
             try:
-                yield "event: hello\ndata: {}\n\n"
+                yield _HELLO
                 while True:
-                    evt = q.get()
-                    yield f"data: {json.dumps(evt, separators=(',', ':'))}\n\n"
+                    try:
+                        frame = q.get(timeout=SSE_KEEPALIVE_SECONDS)
+                    except queue.Empty:
+                        frame = _KEEPALIVE
+                    yield frame
             except GeneratorExit:
                 pass
             finally:
                 ctx.broadcaster.unregister(q)
 
-        return Response(gen(), mimetype="text/event-stream", headers={
+        return Response(gen(), mimetype="text/event-stream", direct_passthrough=True, headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
         })
@@ -186,18 +216,18 @@ def register_routes(app, ctx) -> None:
             if not filename:
                 abort(400, "Missing background file")
             filename = _validate_bg_file(filename)
-            bg_start(filename)
+            submit_audio(bg_start, filename)
             return "OK"
 
         if action == "switch":
             if not filename:
                 abort(400, "Missing background file")
             filename = _validate_bg_file(filename)
-            bg_switch(filename)
+            submit_audio(bg_switch, filename)
             return "OK"
 
         if action == "stop":
-            bg_stop()
+            submit_audio(bg_stop)
             return "OK"
 
         abort(400, "Invalid action")
@@ -207,10 +237,10 @@ def register_routes(app, ctx) -> None:
         h = find_hint_by_id(ctx, hint_id)
         if not h:
             return "Unknown hint", 404
-        hint_play(h["file"])
+        submit_audio(hint_play, h["file"])
         return "OK"
 
     @app.route("/sound/panic")
     def sound_panic():
-        panic()
+        submit_audio(panic)
         return "OK"
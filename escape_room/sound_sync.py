@@ -2,6 +2,8 @@ import time
 
 from mqtt_sound import bg_start, bg_stop, bg_switch, set_language
 
+from .audio_worker import submit_audio
+
 
 BACKGROUND_AUDIO_BY_STATE = {
     "scene_1": ("start", "state1.mp3"),
@@ -10,13 +12,17 @@ BACKGROUND_AUDIO_BY_STATE = {
 }
 
 
-def resync_sound_state(ctx, reason: str = "resync") -> None:
-    snapshot = ctx.snapshot_state()
-    state_name = snapshot["game_state"]
+# These run on the audio worker and read ctx when they execute, so a queued job
+# never pushes a language or background that ctx has already moved past.
+def _apply_language(ctx) -> None:
+    set_language(ctx.snapshot_language())
 
+
+def _apply_sound_state(ctx) -> None:
+    snapshot = ctx.snapshot_index()
     set_language(snapshot["language"])
 
-    bg = BACKGROUND_AUDIO_BY_STATE.get(state_name)
+    bg = BACKGROUND_AUDIO_BY_STATE.get(snapshot["game_state"])
     if bg is None:
         bg_stop()
     else:
@@ -26,10 +32,18 @@ def resync_sound_state(ctx, reason: str = "resync") -> None:
         else:
             bg_switch(filename)
 
+
+def sync_language(ctx) -> None:
+    submit_audio(_apply_language, ctx)
+
+
+def resync_sound_state(ctx, reason: str = "resync") -> None:
+    submit_audio(_apply_sound_state, ctx)
+
     ctx.broadcaster.publish({
         "type": "sound_resync",
         "reason": reason,
-        "game_state": state_name,
+        "game_state": ctx.snapshot_index()["game_state"],
         "ts": time.time(),
     })
 
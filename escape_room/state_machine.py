@@ -3,6 +3,7 @@ from typing import Callable, Optional, Tuple
 
 from mqtt_sound import bg_start, bg_switch, panic
 
+from .audio_worker import submit_audio
 from .config import INPUTS, VALID_GAME_STATES
 
 
@@ -41,11 +42,13 @@ class StateDefinition:
     rules: Tuple[object, ...] = ()
 
 
-def get_label_by_role(role: str) -> Optional[str]:
-    for label, cfg in INPUTS.items():
-        if cfg.get("role") == role:
-            return label
-    return None
+# Reversed so the first input configured with a role wins.
+ROLE_TO_LABEL = {cfg["role"]: label for label, cfg in reversed(INPUTS.items()) if cfg.get("role")}
+
+_RS1 = ROLE_TO_LABEL.get("rs1")
+_RS2 = ROLE_TO_LABEL.get("rs2")
+_RS3 = ROLE_TO_LABEL.get("rs3")
+_T2 = ROLE_TO_LABEL.get("t2")
 
 
 def is_active(label: Optional[str], inputs: dict) -> bool:
@@ -74,13 +77,12 @@ def was_inactive(label: Optional[str], previous_inputs: dict) -> bool:
 
 def book_1_and_2_inactive(event: InputChangeEvent) -> bool:
     return (
-        is_inactive(get_label_by_role("rs1"), event.inputs)
-        and is_inactive(get_label_by_role("rs2"), event.inputs)
+        is_inactive(_RS1, event.inputs)
+        and is_inactive(_RS2, event.inputs)
     )
 
 
-def inactive_to_active_edge(event: InputChangeEvent, role: str) -> bool:
-    label = get_label_by_role(role)
+def inactive_to_active_edge(event: InputChangeEvent, label: Optional[str]) -> bool:
     return (
         event.changed_label == label
         and was_inactive(label, event.previous_inputs)
@@ -88,8 +90,7 @@ def inactive_to_active_edge(event: InputChangeEvent, role: str) -> bool:
     )
 
 
-def active_to_inactive_edge(event: InputChangeEvent, role: str) -> bool:
-    label = get_label_by_role(role)
+def active_to_inactive_edge(event: InputChangeEvent, label: Optional[str]) -> bool:
     return (
         event.changed_label == label
         and was_active(label, event.previous_inputs)
@@ -98,11 +99,11 @@ def active_to_inactive_edge(event: InputChangeEvent, role: str) -> bool:
 
 
 def end_key_active_to_inactive(event: InputChangeEvent) -> bool:
-    return active_to_inactive_edge(event, "rs3")
+    return active_to_inactive_edge(event, _RS3)
 
 
 def toggle_2_inactive_to_active(event: InputChangeEvent) -> bool:
-    return inactive_to_active_edge(event, "t2")
+    return inactive_to_active_edge(event, _T2)
 
 
 STATE_DEFINITIONS = {
@@ -148,6 +149,15 @@ STATE_DEFINITIONS = {
     ),
 }
 
+# Inputs read by the rule guards; snapshots only copy these plus the changed label.
+RULE_INPUT_LABELS = tuple(label for label in (_RS1, _RS2, _RS3, _T2) if label)
+
+STATES_WITHOUT_INPUT_RULES = frozenset(
+    name
+    for name, state in STATE_DEFINITIONS.items()
+    if not any(rule.trigger == INPUT_CHANGE for rule in state.rules)
+)
+
 
 class StateMachine:
     def __init__(self, ctx) -> None:
@@ -157,8 +167,11 @@ class StateMachine:
         if new_state not in ADMIN_OVERRIDE_TARGETS:
             return
 
+        # Only rule-driven re-entry is a no-op; admin overrides and boot always re-run entry actions.
         state = STATE_DEFINITIONS[new_state]
-        self.ctx.prepare_state_entry(new_state, state.entry_actions)
+        force = source != INPUT_CHANGE
+        if not self.ctx.prepare_state_entry(new_state, state.entry_actions, force=force):
+            return
         self.enter_state(state, reason)
 
         from .state import publish_full_state
@@ -174,7 +187,12 @@ class StateMachine:
             self.run_entry_action(action, state.name, reason)
 
     def handle_input_change(self, changed_label: str) -> None:
-        snapshot = self.ctx.snapshot_rule_inputs()
+        snapshot = self.ctx.snapshot_rule_inputs(
+            RULE_INPUT_LABELS + (changed_label,),
+            skip_states=STATES_WITHOUT_INPUT_RULES,
+        )
+        if snapshot is None:
+            return
         event = InputChangeEvent(
             changed_label=changed_label,
             game_state=snapshot["game_state"],
@@ -203,17 +221,17 @@ class StateMachine:
         elif action == "start_timer_if_fresh":
             return
         elif action == "panic":
-            panic()
+            submit_audio(panic)
         elif action == "bg_start_state1":
-            bg_start("state1.mp3")
+            submit_audio(bg_start, "state1.mp3")
         elif action == "bg_switch_state2":
-            bg_switch("state2.mp3")
+            submit_audio(bg_switch, "state2.mp3")
         elif action == "bg_switch_state3":
-            bg_switch("state3.mp3")
+            submit_audio(bg_switch, "state3.mp3")
         elif action == "apply_relay_pattern":
             from .relays import apply_relay_pattern
 
-            apply_relay_pattern(self.ctx, state_name, reason=f"state:{reason}")
+            apply_relay_pattern(self.ctx, state_name)
         else:
             raise ValueError(f"unknown_entry_action:{action}")
 
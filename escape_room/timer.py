@@ -6,16 +6,12 @@ def get_timer_elapsed(ctx) -> float:
 
 
 def stop_timer(ctx, reason: str) -> None:
-    timer = ctx.stop_timer()
-    if timer is None:
+    if ctx.stop_timer() is None:
         return
 
-    ctx.broadcaster.publish({
-        "type": "timer",
-        "timer": timer,
-        "reason": reason,
-        "ts": time.time(),
-    })
+    from .state import publish_full_state
+
+    publish_full_state(ctx, reason=f"timer_stop:{reason}")
 
 
 def toggle_timer(ctx):
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import List
 
 from .cameras import load_camera_streams
@@ -14,6 +15,7 @@ from .config import (
 )
 
 
+@lru_cache(maxsize=None)
 def get_state_ui_config() -> List[dict]:
     return [
         {
@@ -26,6 +28,7 @@ def get_state_ui_config() -> List[dict]:
     ]
 
 
+@lru_cache(maxsize=None)
 def get_relay_ui_config() -> List[dict]:
     return [
         {
@@ -38,6 +41,7 @@ def get_relay_ui_config() -> List[dict]:
     ]
 
 
+@lru_cache(maxsize=None)
 def get_input_ui_config() -> List[dict]:
     inputs = []
     for order, (input_id, cfg) in enumerate(INPUTS.items()):
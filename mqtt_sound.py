@@ -1,12 +1,14 @@
 import json
+import logging
 import os
 import threading
 import time
+from functools import lru_cache
 from typing import Callable, Optional
 
 import paho.mqtt.client as mqtt
 
-print("mqtt_sound loaded", flush=True)
+logger = logging.getLogger(__name__)
 
 SOUND_PI_HOST = os.getenv("SOUND_PI_HOST", "192.168.68.125")
 SOUND_PI_PORT = int(os.getenv("SOUND_PI_PORT", "1883"))
@@ -17,7 +19,8 @@ TOPIC_PANIC = "escape/audio/panic"
 TOPIC_LANGUAGE = "escape/audio/language"
 TOPIC_STATUS = "escape/audio/status"
 
-_client: Optional[mqtt.Client] = None
+_PANIC_PAYLOAD = "{}"
+
 _lock = threading.Lock()
 _monitor_started = False
 _broker_connected = False
@@ -32,12 +35,17 @@ _ready_callbacks: list[Callable[[], None]] = []
 _status_callbacks: list[Callable[[dict], None]] = []
 
 
-def _log(message: str) -> None:
-    print(f"[mqtt_sound] {message}", flush=True)
+# Bounded: /sound/bg accepts any stateN.mp3, so the key space is client-controlled.
+@lru_cache(maxsize=32)
+def _payload(cmd: str, filename: Optional[str] = None) -> str:
+    data = {"cmd": cmd}
+    if filename is not None:
+        data["file"] = filename
+    return json.dumps(data, separators=(",", ":"))
 
 
 def _make_client() -> mqtt.Client:
-    client = mqtt.Client()
+    client = mqtt.Client(client_id="escape-ctrl", clean_session=True)
     client.reconnect_delay_set(min_delay=1, max_delay=30)
     client.on_connect = _on_connect
     client.on_disconnect = _on_disconnect
@@ -46,7 +54,7 @@ def _make_client() -> mqtt.Client:
 
 
 def start_monitor(on_ready: Optional[Callable[[], None]] = None, on_status: Optional[Callable[[dict], None]] = None) -> None:
-    global _client, _monitor_started
+    global _monitor_started
 
     if on_ready is not None:
         register_ready_callback(on_ready)
@@ -57,16 +65,13 @@ def start_monitor(on_ready: Optional[Callable[[], None]] = None, on_status: Opti
         if _monitor_started:
             return
         _monitor_started = True
-        if _client is None:
-            _client = _make_client()
-        client = _client
 
     try:
-        _log(f"starting MQTT monitor for {SOUND_PI_HOST}:{SOUND_PI_PORT}")
-        client.connect_async(SOUND_PI_HOST, SOUND_PI_PORT, keepalive=10)
-        client.loop_start()
+        logger.info("starting MQTT monitor for %s:%s", SOUND_PI_HOST, SOUND_PI_PORT)
+        _client.connect_async(SOUND_PI_HOST, SOUND_PI_PORT, keepalive=10)
+        _client.loop_start()
     except Exception as exc:
-        _log(f"MQTT monitor start failed: {exc}")
+        logger.warning("MQTT monitor start failed: %s", exc)
         _set_broker_connected(False)
 
 
@@ -82,20 +87,20 @@ def register_status_callback(callback: Callable[[dict], None]) -> None:
 
 def _on_connect(client, userdata, flags, rc):
     if rc == 0:
-        _log("MQTT broker reachable")
+        logger.info("MQTT broker reachable")
         _set_broker_connected(True)
         try:
             client.subscribe(TOPIC_STATUS)
-            _log(f"subscribed to {TOPIC_STATUS}")
+            logger.info("subscribed to %s", TOPIC_STATUS)
         except Exception as exc:
-            _log(f"MQTT status subscribe failed: {exc}")
+            logger.warning("MQTT status subscribe failed: %s", exc)
     else:
-        _log(f"MQTT broker connect failed rc={rc}")
+        logger.warning("MQTT broker connect failed rc=%s", rc)
         _set_broker_connected(False)
 
 
 def _on_disconnect(client, userdata, rc):
-    _log(f"MQTT broker unreachable rc={rc}")
+    logger.warning("MQTT broker unreachable rc=%s", rc)
     _set_broker_connected(False)
 
 
@@ -106,10 +111,14 @@ def _on_message(client, userdata, msg):
     payload = msg.payload.decode("utf-8", errors="replace").strip()
     retained = bool(getattr(msg, "retain", False))
     ok = _status_payload_is_ok(payload)
-    _log(f"sound status received ready={ok} retained={retained} payload={payload!r}")
+    logger.debug("sound status received ready=%s retained=%s payload=%r", ok, retained, payload)
     _set_sound_status(ok, payload)
 
 
+# Single shared client; start_monitor() connects it and runs paho's network thread.
+_client = _make_client()
+
+
 def _status_payload_is_ok(payload: str) -> bool:
     if not payload:
         return False
@@ -165,7 +174,7 @@ def _set_sound_status(ready: bool, payload: str) -> None:
             _last_sent_language = None
             _last_sent_bg_payload = None
         if was_ready != _sound_ready:
-            _log(f"sound ready {was_ready} -> {_sound_ready}")
+            logger.info("sound ready %s -> %s", was_ready, _sound_ready)
             status_callbacks = list(_status_callbacks)
             if _sound_ready:
                 callbacks = list(_ready_callbacks)
@@ -183,7 +192,7 @@ def _emit_ready(callbacks: list[Callable[[], None]]) -> None:
         try:
             callback()
         except Exception as exc:
-            _log(f"sound ready callback failed: {exc}")
+            logger.warning("sound ready callback failed: %s", exc)
 
 
 def _emit_status(callbacks: list[Callable[[dict], None]]) -> None:
@@ -192,7 +201,7 @@ def _emit_status(callbacks: list[Callable[[dict], None]]) -> None:
         try:
             callback(snapshot)
         except Exception as exc:
-            _log(f"sound status callback failed: {exc}")
+            logger.warning("sound status callback failed: %s", exc)
 
 
 def get_status() -> dict:
@@ -208,38 +217,27 @@ def get_status() -> dict:
         }
 
 
-def _get_client() -> Optional[mqtt.Client]:
-    start_monitor()
-    with _lock:
-        return _client
-
-
 def _is_ready() -> bool:
     with _lock:
         return _broker_connected and _sound_ready
 
 
 def _publish_now(topic: str, payload: str) -> bool:
-    client = _get_client()
-    if client is None:
-        _log(f"MQTT unavailable, cannot publish to {topic}")
-        return False
-
     if not _is_ready():
-        _log(f"sound not ready, deferred publish to {topic}")
+        logger.debug("sound not ready, deferred publish to %s", topic)
         return False
 
     try:
-        result = client.publish(topic, payload, qos=0)
+        result = _client.publish(topic, payload, qos=0)
     except Exception as exc:
-        _log(f"MQTT publish failed for {topic}: {exc}")
+        logger.warning("MQTT publish failed for %s: %s", topic, exc)
         return False
 
     if result.rc != mqtt.MQTT_ERR_SUCCESS:
-        _log(f"MQTT publish failed for {topic}: rc={result.rc}")
+        logger.warning("MQTT publish failed for %s: rc=%s", topic, result.rc)
         return False
 
-    _log(f"published to {topic}: {payload}")
+    logger.debug("published to %s: %s", topic, payload)
     return True
 
 
@@ -253,10 +251,10 @@ def flush_desired_state(reason: str = "manual") -> None:
         last_bg_payload = _last_sent_bg_payload
 
     if not _is_ready():
-        _log(f"audio desired state deferred reason={reason}")
+        logger.debug("audio desired state deferred reason=%s", reason)
         return
 
-    _log(f"audio desired state flushed/resynced reason={reason}")
+    logger.debug("audio desired state flushed/resynced reason=%s", reason)
     if language and language != last_language:
         if _publish_now(TOPIC_LANGUAGE, json.dumps({"language": language})):
             with _lock:
@@ -268,7 +266,7 @@ def flush_desired_state(reason: str = "manual") -> None:
 
 
 def bg_start(filename: str):
-    payload = json.dumps({"cmd": "start", "file": filename})
+    payload = _payload("start", filename)
     with _lock:
         global _desired_bg_payload
         _desired_bg_payload = payload
@@ -276,7 +274,7 @@ def bg_start(filename: str):
 
 
 def bg_switch(filename: str):
-    payload = json.dumps({"cmd": "switch", "file": filename})
+    payload = _payload("switch", filename)
     with _lock:
         global _desired_bg_payload
         _desired_bg_payload = payload
@@ -284,7 +282,7 @@ def bg_switch(filename: str):
 
 
 def bg_stop():
-    payload = json.dumps({"cmd": "stop"})
+    payload = _payload("stop")
     with _lock:
         global _desired_bg_payload
         _desired_bg_payload = payload
@@ -292,14 +290,14 @@ def bg_stop():
 
 
 def hint_play(filename: str):
-    payload = json.dumps({"cmd": "play", "file": filename})
+    payload = _payload("play", filename)
     if not _publish_now(TOPIC_HINT, payload):
-        _log(f"hint not replayed because sound is not ready: {filename}")
+        logger.warning("hint not replayed because sound is not ready: %s", filename)
 
 
 def panic():
-    if not _publish_now(TOPIC_PANIC, "{}"):
-        _log("panic not replayed because sound is not ready")
+    if not _publish_now(TOPIC_PANIC, _PANIC_PAYLOAD):
+        logger.warning("panic not replayed because sound is not ready")
 
 
 def set_language(language: str):
@@ -12,6 +12,7 @@
     text: appConfig.text || {}
   };
   let currentLanguage = "nl";
+  const SSE_REOPEN_DELAY_MS = 30000;
 
   const escapeStatusEl = document.getElementById("escape-status");
   const soundDotEl = document.getElementById("sound-status");
@@ -513,15 +514,24 @@
     });
   }
 
-  function connectSSE() {
+  function connectSSE(isReconnect = false) {
     const es = new EventSource("/events");
 
     es.addEventListener("open", () => {
       setStatusDot(escapeStatusEl, true);
+      // Events were missed while the stream was closed; resync from the API.
+      if (isReconnect) {
+        loadInitial().catch((e) => console.error("Failed to resync after reconnect", e));
+      }
     });
 
     es.addEventListener("error", () => {
       setStatusDot(escapeStatusEl, false);
+      // The browser only retries dropped streams itself; a refused one (e.g. the
+      // server's 503 when too many dashboards are open) stays closed, so reopen it.
+      if (es.readyState === EventSource.CLOSED) {
+        setTimeout(() => connectSSE(true), SSE_REOPEN_DELAY_MS);
+      }
     });
 
     es.onmessage = (msg) => {